@@ -94,7 +94,11 @@ class VQAlgorithm(QuantumAlgorithm):
         optimizer = optimizer if optimizer is not None else self._optimizer
 
         nparms = var_form.num_parameters
-        bounds = var_form.parameter_bounds
+        # prefer the cached ndarray view of the bounds; fall back to the
+        # raw bounds when the problem is not fully bounded
+        bounds = var_form.parameter_bounds_array
+        if bounds is None:
+            bounds = var_form.parameter_bounds
 
         if initial_point is not None and len(initial_point) != nparms:
             raise ValueError(
@@ -16,6 +16,7 @@
 
 import numpy as np
 from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.circuit import ParameterVector
 from qiskit.aqua.utils.validation import validate
 from qiskit.aqua.components.variational_forms import VariationalForm
 
@@ -114,21 +115,29 @@ class RY(VariationalForm):
         self._bounds = [(-np.pi, np.pi)] * self._num_parameters
         self._support_parameterized_circuit = True
 
-    def construct_circuit(self, parameters, q=None):
+    def construct_parameterized_circuit(self, q=None, parameter_vector=None):
         """
-        Construct the variational form, given its parameters.
+        Construct a parameterized (symbolic) version of the variational form.
+
+        The base class construct_circuit caches the circuit built here and
+        only rebinds parameter values on subsequent calls.
 
         Args:
-            parameters (Union(numpy.ndarray, list[Parameter], ParameterVector)): circuit parameters.
             q (QuantumRegister): Quantum Register for the circuit.
+            parameter_vector (Union(list[Parameter], ParameterVector)):
+                symbolic parameters to build the circuit with; a fresh
+                ParameterVector is created when None.
 
         Returns:
-            QuantumCircuit: a quantum circuit with given `parameters`
+            tuple(QuantumCircuit, ParameterVector): the symbolic circuit and
+                the parameters to bind values to.
 
         Raises:
             ValueError: the number of parameters is incorrect.
         """
-        if len(parameters) != self._num_parameters:
+        if parameter_vector is None:
+            parameter_vector = ParameterVector('θ', self._num_parameters)
+        if len(parameter_vector) != self._num_parameters:
             raise ValueError('The number of parameters has to be {}'.format(self._num_parameters))
 
         if q is None:
@@ -141,7 +150,7 @@ class RY(VariationalForm):
         param_idx = 0
         for qubit in range(self._num_qubits):
             if not self._skip_unentangled_qubits or qubit in self._entangled_qubits:
-                circuit.u3(parameters[param_idx], 0.0, 0.0, q[qubit])  # ry
+                circuit.u3(parameter_vector[param_idx], 0.0, 0.0, q[qubit])  # ry
                 param_idx += 1
 
         for block in range(self._depth):
@@ -159,7 +168,7 @@ class RY(VariationalForm):
                     circuit.u2(0.0, np.pi, q[targ])  # h
 
                 elif self._entanglement_gate == 'crx':
-                    circuit.cu3(parameters[param_idx], -np.pi / 2, np.pi / 2,
+                    circuit.cu3(parameter_vector[param_idx], -np.pi / 2, np.pi / 2,
                                 q[src], q[targ])  # crx
                     param_idx += 1
 
@@ -171,8 +180,8 @@ class RY(VariationalForm):
             if not self._skip_final_ry or block != self._depth - 1:
                 circuit.barrier(q)
                 for qubit in self._entangled_qubits:
-                    circuit.u3(parameters[param_idx], 0.0, 0.0, q[qubit])  # ry
+                    circuit.u3(parameter_vector[param_idx], 0.0, 0.0, q[qubit])  # ry
                     param_idx += 1
         circuit.barrier(q)
 
-        return circuit
+        return circuit, parameter_vector
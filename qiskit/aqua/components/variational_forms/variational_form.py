@@ -17,10 +17,27 @@ variational forms. Several types of commonly used ansatz.
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
+import numpy as np
+
+from qiskit.circuit import Parameter, ParameterVector
 from qiskit.aqua.utils import get_entangler_map, validate_entangler_map
 
 
+@lru_cache(maxsize=128)
+def _cached_entangler_map(map_type, num_qubits, offset):
+    # tuple-of-tuples so the memoized result is hashable and cannot be
+    # mutated through the copies handed out to callers
+    return tuple(map(tuple, get_entangler_map(map_type, num_qubits, offset)))
+
+
+@lru_cache(maxsize=128)
+def _cached_validated_entangler_map(entangler_map, num_qubits):
+    validated = validate_entangler_map([list(pair) for pair in entangler_map], num_qubits)
+    return tuple(map(tuple, validated))
+
+
 class VariationalForm(ABC):
 
     """Base class for VariationalForms.
@@ -30,25 +47,75 @@ class VariationalForm(ABC):
         available.
     """
 
+    # Defaults live at class scope so every subclass inherits them for
+    # free; instances only pay an attribute store for values they change.
+    _num_parameters = 0
+    _num_qubits = 0
+    _bounds_value = ()
+    _bounds_array = None
+    _support_parameterized_circuit = False
+    _template_circuit = None
+    _template_register = None
+    _parameter_vector = None
+
     @abstractmethod
     def __init__(self):
-        super().__init__()
-        self._num_parameters = 0
-        self._num_qubits = 0
-        self._bounds = list()
-        self._support_parameterized_circuit = False
         pass
 
-    @abstractmethod
     def construct_circuit(self, parameters, q=None):
         """Construct the variational form, given its parameters.
 
+        The default implementation builds the symbolic template returned
+        by construct_parameterized_circuit once, caches it, and each call
+        only binds the given values, avoiding a full gate-by-gate circuit
+        reconstruction per parameter update. Symbolic Parameter input is
+        handed through to the template construction so the returned
+        circuit is expressed in the caller's parameters. Subclasses can
+        either supply the template or override this method entirely.
+
         Args:
-            parameters (numpy.ndarray[float]): circuit parameters.
+            parameters (Union(numpy.ndarray, list[Parameter], ParameterVector)):
+                circuit parameters.
             q (QuantumRegister): Quantum Register for the circuit.
 
         Returns:
             QuantumCircuit: A quantum circuit.
+
+        Raises:
+            ValueError: the number of parameters is incorrect.
+        """
+        if len(parameters) != self._num_parameters:
+            raise ValueError('The number of parameters has to be {}'.format(
+                self._num_parameters))
+
+        if isinstance(parameters, ParameterVector) or \
+                (len(parameters) > 0 and isinstance(parameters[0], Parameter)):
+            circuit, _ = self.construct_parameterized_circuit(
+                q=q, parameter_vector=parameters)
+            return circuit
+
+        if self._template_circuit is None or q is not self._template_register:
+            self._template_circuit, self._parameter_vector = \
+                self.construct_parameterized_circuit(q=q)
+            self._template_register = q
+        return self._template_circuit.bind_parameters(
+            dict(zip(self._parameter_vector, parameters)))
+
+    def construct_parameterized_circuit(self, q=None, parameter_vector=None):
+        """Construct a parameterized (symbolic) version of the variational form.
+
+        Built once and cached by the default construct_circuit, which
+        then simply rebinds parameter values on every call.
+
+        Args:
+            q (QuantumRegister): Quantum Register for the circuit.
+            parameter_vector (Union(list[Parameter], ParameterVector)):
+                symbolic parameters to build the circuit with;
+                implementations create a fresh ParameterVector when None.
+
+        Returns:
+            tuple(QuantumCircuit, ParameterVector): the symbolic circuit
+                and the parameters to bind values to.
         """
         raise NotImplementedError()
 
@@ -84,28 +151,55 @@ class VariationalForm(ABC):
         """
         return self._num_qubits
 
+    @property
+    def _bounds(self):
+        return self._bounds_value
+
+    @_bounds.setter
+    def _bounds(self, bounds):
+        # any reassignment, e.g. by adaptive forms managing their operator
+        # pool, invalidates the cached array view of the previous bounds
+        self._bounds_value = bounds
+        self._bounds_array = None
+
     @property
     def parameter_bounds(self):
         """Parameter bounds.
 
         Returns:
-            list: A list of pairs indicating the bounds, as (lower,
+            tuple: A sequence of pairs indicating the bounds, as (lower,
             upper). None indicates an unbounded parameter in the
             corresponding direction. If None is returned, problem is
             fully unbounded.
         """
+        if not isinstance(self._bounds, tuple):
+            # freeze once; optimizers iterate the bounds every step
+            self._bounds = tuple(self._bounds)
         return self._bounds
 
+    @property
+    def parameter_bounds_array(self):
+        """Parameter bounds as a NumPy array, computed once and cached.
+
+        Returns:
+            numpy.ndarray: float64 array of (lower, upper) pairs for
+            optimizers taking ndarray bounds, or None when any bound is
+            None, i.e. the problem is not fully bounded.
+        """
+        bounds = self.parameter_bounds
+        if self._bounds_array is None:
+            if any(lower is None or upper is None for lower, upper in bounds):
+                return None
+            self._bounds_array = np.asarray(bounds, dtype=np.float64)
+        return self._bounds_array
+
     @property
     def setting(self):
         """ setting """
-        ret = "Variational Form: {}\n".format(self.__class__.__name__)
-        params = ""
-        for key, value in self.__dict__.items():
-            if key[0] == "_":
-                params += "-- {}: {}\n".format(key[1:], value)
-        ret += "{}".format(params)
-        return ret
+        params = "".join("-- {}: {}\n".format(key[1:], value)
+                         for key, value in self.__dict__.items()
+                         if key.startswith("_"))
+        return "Variational Form: {}\n{}".format(self.__class__.__name__, params)
 
     @property
     def preferred_init_points(self):
@@ -114,10 +208,16 @@ class VariationalForm(ABC):
 
     @staticmethod
     def get_entangler_map(map_type, num_qubits, offset=0):
-        """ returns entangler map """
-        return get_entangler_map(map_type, num_qubits, offset)
+        """ returns entangler map as a fresh list of [source, target] lists """
+        return [list(pair) for pair in _cached_entangler_map(map_type, num_qubits, offset)]
 
     @staticmethod
     def validate_entangler_map(entangler_map, num_qubits):
-        """ validate entangler map """
-        return validate_entangler_map(entangler_map, num_qubits)
+        """ validate entangler map, returning a fresh list of [source, target] lists """
+        if not isinstance(entangler_map, list) or \
+                not all(isinstance(src_to_targ, list) for src_to_targ in entangler_map):
+            # not hashable into the cache; let the helper raise its
+            # documented type errors
+            return validate_entangler_map(entangler_map, num_qubits)
+        validated = _cached_validated_entangler_map(tuple(map(tuple, entangler_map)), num_qubits)
+        return [list(pair) for pair in validated]
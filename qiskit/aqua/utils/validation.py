@@ -21,6 +21,20 @@ import numpy as np
 import jsonschema
 from qiskit.aqua import AquaError
 
+# Compiled validators keyed by schema identity. Schemas are class-level
+# constants so compiling them once avoids re-parsing on every validation;
+# the schema itself is kept in the value so its id cannot be reused.
+_VALIDATORS = {}
+
+
+def _compiled_validator(schema_dict):
+    """ returns a compiled validator for the schema, compiling it on first use """
+    entry = _VALIDATORS.get(id(schema_dict))
+    if entry is None:
+        entry = (schema_dict, jsonschema.Draft7Validator(schema_dict))
+        _VALIDATORS[id(schema_dict)] = entry
+    return entry[1]
+
 
 def validate(args_dict, schema_dict):
     """ validate json data according to a schema"""
@@ -40,6 +54,6 @@ def validate(args_dict, schema_dict):
 
             json_dict[property_name] = value
     try:
-        jsonschema.validate(json_dict, schema_dict)
+        _compiled_validator(schema_dict).validate(json_dict)
     except jsonschema.exceptions.ValidationError as vex:
         raise AquaError(vex.message)
@@ -14,6 +14,7 @@
 
 """ HDF5 Driver """
 
+import io
 import os
 import logging
 from qiskit.chemistry.drivers import BaseDriver
@@ -27,6 +28,11 @@ class HDF5Driver(BaseDriver):
 
     KEY_HDF5_INPUT = 'hdf5_input'
 
+    # Repeat runs cache files up to this size in memory; larger files keep
+    # being opened from disk so on-demand dataset access still avoids
+    # reading tensors the caller never touches.
+    _IN_MEMORY_SIZE_LIMIT = 256 * 1024 * 1024
+
     def __init__(self, hdf5_input=None):
         """
         Initializer
@@ -39,6 +45,24 @@ class HDF5Driver(BaseDriver):
         super().__init__()
         self._hdf5_input = hdf5_input
         self._work_path = None
+        self._resolved_path = None
+        self._file_bytes = None
+        self._file_id = None
+        self._ran_once = False
+
+    @property
+    def hdf5_input(self):
+        """ returns hdf5 input """
+        return self._hdf5_input
+
+    @hdf5_input.setter
+    def hdf5_input(self, new_hdf5_input):
+        """ sets hdf5 input """
+        self._hdf5_input = new_hdf5_input
+        self._resolved_path = None
+        self._file_bytes = None
+        self._file_id = None
+        self._ran_once = False
 
     @property
     def work_path(self):
@@ -49,15 +73,68 @@ class HDF5Driver(BaseDriver):
     def work_path(self, new_work_path):
         """ sets work path """
         self._work_path = new_work_path
+        self._resolved_path = None
+        self._file_bytes = None
+        self._file_id = None
+        self._ran_once = False
 
     def run(self):
-        hdf5_file = self._hdf5_input
-        if self.work_path is not None and not os.path.isabs(hdf5_file):
-            hdf5_file = os.path.abspath(os.path.join(self.work_path, hdf5_file))
+        """Runs the driver.
+
+        Returns:
+            QMolecule: molecule reading its datasets on demand from an open
+                handle on the file. The handle is released by close(), by
+                using the molecule as a context manager, or on garbage
+                collection; attributes first accessed after that return
+                their unloaded value.
+
+        Raises:
+            LookupError: file not found.
+        """
+        # resolve and validate the path once, reruns then skip the
+        # os.path/stat work entirely
+        hdf5_file = self._resolved_path
+        if hdf5_file is None:
+            hdf5_file = self._hdf5_input
+            if self._work_path is not None and not os.path.isabs(hdf5_file):
+                hdf5_file = os.path.abspath(os.path.join(self._work_path, hdf5_file))
+
+            if not os.path.isfile(hdf5_file):
+                raise LookupError('HDF5 file not found: {}'.format(hdf5_file))
+
+            self._resolved_path = hdf5_file
 
-        if not os.path.isfile(hdf5_file):
-            raise LookupError('HDF5 file not found: {}'.format(hdf5_file))
+        # A repeat run signals the file is being reused, e.g. across the
+        # iterations of a variational loop. Files small enough are then
+        # read into memory once and every later open is served from there,
+        # skipping disk and the per-open metadata parsing; larger files
+        # keep being opened from disk so on-demand access still avoids
+        # reading datasets the caller never touches. The first run stays
+        # on-demand from disk so a one-shot caller never pays for a full
+        # read.
+        if self._ran_once:
+            try:
+                stat = os.stat(hdf5_file)
+                file_id = (stat.st_size, stat.st_mtime)
+                if self._file_bytes is not None and file_id != self._file_id:
+                    # the file was rewritten in place between runs
+                    self._file_bytes = None
+                if self._file_bytes is None and stat.st_size <= self._IN_MEMORY_SIZE_LIMIT:
+                    with open(hdf5_file, 'rb') as file:
+                        self._file_bytes = file.read()
+                    self._file_id = file_id
+            except OSError as ex:
+                # the file can vanish between runs; re-resolve next time and
+                # keep the driver's established error contract
+                self._resolved_path = None
+                self._file_bytes = None
+                self._file_id = None
+                raise LookupError('HDF5 file not found: {}'.format(hdf5_file)) from ex
+        self._ran_once = True
 
         molecule = QMolecule(hdf5_file)
-        molecule.load()
+        if self._file_bytes is not None:
+            molecule.open(io.BytesIO(self._file_bytes))
+        else:
+            molecule.open()
         return molecule
@@ -24,6 +24,8 @@ from qiskit.chemistry.drivers.pyquanted.integrals import compute_integrals
 
 logger = logging.getLogger(__name__)
 
+_NEWLINE_TO_SEMICOLON = str.maketrans('\n', ';')
+
 
 class BasisType(Enum):
     """ Basis Type """
@@ -38,6 +40,8 @@ class PyQuanteDriver(BaseDriver):
     KEY_UNITS = 'units'
     KEY_BASIS = 'basis'
 
+    _pyquante_available = None
+
     _INPUT_SCHEMA = {
         "$schema": "http://json-schema.org/draft-07/schema#",
         "id": "pyquante_schema",
@@ -122,13 +126,18 @@ class PyQuanteDriver(BaseDriver):
 
         if isinstance(atoms, list):
             atoms = ';'.join(atoms)
-        else:
-            atoms = atoms.replace('\n', ';')
+        elif '\n' in atoms:
+            # skip the copy for already-normalized strings; translate with a
+            # single-char table is the fastest path for long atom lists
+            atoms = atoms.translate(_NEWLINE_TO_SEMICOLON)
 
         units = units.value
         basis = basis.value
         hf_method = hf_method.value
-        validate(locals(), self._INPUT_SCHEMA)
+        validate({'atoms': atoms, 'units': units, 'charge': charge,
+                  'multiplicity': multiplicity, 'basis': basis,
+                  'hf_method': hf_method, 'tol': tol, 'maxiters': maxiters},
+                 self._INPUT_SCHEMA)
         super().__init__()
         self._atoms = atoms
         self._units = units
@@ -138,19 +147,27 @@ class PyQuanteDriver(BaseDriver):
         self._hf_method = hf_method
         self._tol = tol
         self._maxiters = maxiters
+        # the inputs are immutable after construction so the driver config
+        # can be built once here rather than on every run() call
+        self._driver_config = '\n'.join(
+            '{}={}'.format(key, getattr(self, '_' + key))
+            for key in ('atoms', 'units', 'charge', 'multiplicity',
+                        'basis', 'hf_method', 'tol', 'maxiters')) + '\n'
 
     @staticmethod
     def _check_valid():
         err_msg = 'PyQuante2 is not installed. See https://github.com/rpmuller/pyquante2'
-        try:
-            spec = importlib.util.find_spec('pyquante2')
-            if spec is not None:
-                return
-        except Exception as ex:  # pylint: disable=broad-except
-            logger.debug('PyQuante2 check error %s', str(ex))
-            raise QiskitChemistryError(err_msg) from ex
-
-        raise QiskitChemistryError(err_msg)
+        if PyQuanteDriver._pyquante_available is None:
+            try:
+                spec = importlib.util.find_spec('pyquante2')
+                PyQuanteDriver._pyquante_available = spec is not None
+            except Exception as ex:  # pylint: disable=broad-except
+                logger.debug('PyQuante2 check error %s', str(ex))
+                PyQuanteDriver._pyquante_available = False
+                raise QiskitChemistryError(err_msg) from ex
+
+        if not PyQuanteDriver._pyquante_available:
+            raise QiskitChemistryError(err_msg)
 
     def run(self):
         q_mol = compute_integrals(atoms=self._atoms,
@@ -163,15 +180,6 @@ class PyQuanteDriver(BaseDriver):
                                   maxiters=self._maxiters)
 
         q_mol.origin_driver_name = 'PYQUANTE'
-        cfg = ['atoms={}'.format(self._atoms),
-               'units={}'.format(self._units),
-               'charge={}'.format(self._charge),
-               'multiplicity={}'.format(self._multiplicity),
-               'basis={}'.format(self._basis),
-               'hf_method={}'.format(self._hf_method),
-               'tol={}'.format(self._tol),
-               'maxiters={}'.format(self._maxiters),
-               '']
-        q_mol.origin_driver_config = '\n'.join(cfg)
+        q_mol.origin_driver_config = self._driver_config
 
         return q_mol
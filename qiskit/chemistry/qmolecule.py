@@ -31,9 +31,59 @@ class QMolecule:
 
     QMOLECULE_VERSION = 2
 
+    # Maps each attribute saved by save() to its HDF5 dataset path, how the
+    # raw dataset converts back to an attribute value and the first save
+    # format version in which it appears. Attributes from a newer version
+    # than the file being read are set to their unloaded value.
+    _H5_ATTRIBUTES = {
+        'origin_driver_name': ('origin_driver/name', 'string', 1),
+        'origin_driver_version': ('origin_driver/version', 'string', 2),
+        'origin_driver_config': ('origin_driver/config', 'string', 1),
+        'hf_energy': ('energy/hf_energy', 'float', 1),
+        'nuclear_repulsion_energy': ('energy/nuclear_repulsion_energy', 'float', 1),
+        'num_orbitals': ('orbitals/num_orbitals', 'int', 1),
+        'num_alpha': ('orbitals/num_alpha', 'int', 1),
+        'num_beta': ('orbitals/num_beta', 'int', 1),
+        'mo_coeff': ('orbitals/mo_coeff', 'array', 1),
+        'mo_coeff_b': ('orbitals/mo_coeff_B', 'array', 2),
+        'orbital_energies': ('orbitals/orbital_energies', 'array', 1),
+        'orbital_energies_b': ('orbitals/orbital_energies_B', 'array', 2),
+        'molecular_charge': ('geometry/molecular_charge', 'int', 1),
+        'multiplicity': ('geometry/multiplicity', 'int', 1),
+        'num_atoms': ('geometry/num_atoms', 'int', 1),
+        'atom_symbol': ('geometry/atom_symbol', 'string_list', 1),
+        'atom_xyz': ('geometry/atom_xyz', 'raw', 1),
+        'hcore': ('integrals/hcore', 'array', 2),
+        'hcore_b': ('integrals/hcore_B', 'array', 2),
+        'kinetic': ('integrals/kinetic', 'array', 2),
+        'overlap': ('integrals/overlap', 'array', 2),
+        'eri': ('integrals/eri', 'array', 2),
+        'mo_onee_ints': ('integrals/mo_onee_ints', 'array', 1),
+        'mo_onee_ints_b': ('integrals/mo_onee_ints_B', 'array', 2),
+        'mo_eri_ints': ('integrals/mo_eri_ints', 'array', 1),
+        'mo_eri_ints_bb': ('integrals/mo_eri_ints_BB', 'array', 2),
+        'mo_eri_ints_ba': ('integrals/mo_eri_ints_BA', 'array', 2),
+        'x_dip_ints': ('dipole/x_dip_ints', 'array', 2),
+        'y_dip_ints': ('dipole/y_dip_ints', 'array', 2),
+        'z_dip_ints': ('dipole/z_dip_ints', 'array', 2),
+        'x_dip_mo_ints': ('dipole/x_dip_mo_ints', 'array', 1),
+        'x_dip_mo_ints_b': ('dipole/x_dip_mo_ints_B', 'array', 2),
+        'y_dip_mo_ints': ('dipole/y_dip_mo_ints', 'array', 1),
+        'y_dip_mo_ints_b': ('dipole/y_dip_mo_ints_B', 'array', 2),
+        'z_dip_mo_ints': ('dipole/z_dip_mo_ints', 'array', 1),
+        'z_dip_mo_ints_b': ('dipole/z_dip_mo_ints_B', 'array', 2),
+        'nuclear_dipole_moment': ('dipole/nuclear_dipole_moment', 'raw', 1),
+        'reverse_dipole_sign': ('dipole/reverse_dipole_sign', 'raw', 1),
+    }
+
     def __init__(self, filename=None):
         self._filename = filename
 
+        # HDF5 file handle and save format version used for on-demand
+        # loading, see open()
+        self._h5_file = None
+        self._h5_file_version = None
+
         # All the following fields are saved/loaded in the save/load methods.
         # If fields are added in a version they are noted by version comment
         #
@@ -165,101 +215,144 @@ class QMolecule:
 
         return self._filename
 
-    def load(self):
-        """loads info saved."""
+    # Raw data chunk cache size used when reading. The h5py default of
+    # 1MiB forces large integral tensors to be serviced by many small
+    # reads; a bigger cache lets HDF5 issue fewer, larger I/O requests.
+    _H5_RDCC_NBYTES = 16 * 1024 * 1024
+
+    @staticmethod
+    def _h5_file_format_version(h5_file):
+        # A version field was added to save format from version 2 so if
+        # there is no version then we have original (version 1) format.
+        # Read it directly and handle the miss rather than paying for a
+        # separate existence check first.
+        version = 1
+        try:
+            data = h5_file["version"][...]
+            version = int(data) if data.dtype.num != 0 else version
+        except KeyError:
+            pass
+        return version
+
+    @staticmethod
+    def _read_h5_dataset(h5_file, path, kind):
+        dataset = h5_file[path]
+        if kind == 'string':
+            return dataset[...].tobytes().decode('utf-8')
+        if kind == 'int':
+            data = dataset[...]
+            return int(data) if data.dtype.num != 0 else None
+        if kind == 'float':
+            data = dataset[...]
+            return float(data) if data.dtype.num != 0 else None
+        if kind == 'string_list':
+            return [a.decode('utf8') for a in dataset[...]]
+
+        # arrays: read in one contiguous transfer into a preallocated buffer
+        data = numpy.empty(dataset.shape, dtype=dataset.dtype)
+        dataset.read_direct(data)
+        if kind == 'array' and data.dtype == numpy.bool and data.size == 1 and not data:
+            return None
+        return data
+
+    def load(self, keys=None):
+        """loads info saved.
+
+        Args:
+            keys (list[str]): attribute names to load; all saved
+                attributes are loaded when None.
+        """
         try:
             if self._filename is None:
                 return
 
-            with h5py.File(self._filename, "r") as file:
-                def read_array(name):
-                    _data = file[name][...]
-                    if _data.dtype == numpy.bool and _data.size == 1 and not _data:
-                        _data = None
-                    return _data
-
-                # A version field was added to save format from version 2 so if
-                # there is no version then we have original (version 1) format
-                version = 1
-                if 'version' in file.keys():
-                    data = file["version"][...]
-                    version = int(data) if data.dtype.num != 0 else version
-
-                # Origin driver info
-                data = file["origin_driver/name"][...]
-                self.origin_driver_name = data[...].tobytes().decode('utf-8')
-                self.origin_driver_version = '?'
-                if version > 1:
-                    data = file["origin_driver/version"][...]
-                    self.origin_driver_version = data[...].tobytes().decode('utf-8')
-                data = file["origin_driver/config"][...]
-                self.origin_driver_config = data[...].tobytes().decode('utf-8')
-
-                # Energies
-                data = file["energy/hf_energy"][...]
-                self.hf_energy = float(data) if data.dtype.num != 0 else None
-                data = file["energy/nuclear_repulsion_energy"][...]
-                self.nuclear_repulsion_energy = float(data) if data.dtype.num != 0 else None
-
-                # Orbitals
-                data = file["orbitals/num_orbitals"][...]
-                self.num_orbitals = int(data) if data.dtype.num != 0 else None
-                data = file["orbitals/num_alpha"][...]
-                self.num_alpha = int(data) if data.dtype.num != 0 else None
-                data = file["orbitals/num_beta"][...]
-                self.num_beta = int(data) if data.dtype.num != 0 else None
-                self.mo_coeff = read_array("orbitals/mo_coeff")
-                self.mo_coeff_b = read_array("orbitals/mo_coeff_B") if version > 1 else None
-                self.orbital_energies = read_array("orbitals/orbital_energies")
-                self.orbital_energies_b = \
-                    read_array("orbitals/orbital_energies_B") if version > 1 else None
-
-                # Molecule geometry
-                data = file["geometry/molecular_charge"][...]
-                self.molecular_charge = int(data) if data.dtype.num != 0 else None
-                data = file["geometry/multiplicity"][...]
-                self.multiplicity = int(data) if data.dtype.num != 0 else None
-                data = file["geometry/num_atoms"][...]
-                self.num_atoms = int(data) if data.dtype.num != 0 else None
-                data = file["geometry/atom_symbol"][...]
-                self.atom_symbol = [a.decode('utf8') for a in data]
-                self.atom_xyz = file["geometry/atom_xyz"][...]
-
-                # 1 and 2 electron integrals in AO basis
-                self.hcore = read_array("integrals/hcore") if version > 1 else None
-                self.hcore_b = read_array("integrals/hcore_B") if version > 1 else None
-                self.kinetic = read_array("integrals/kinetic") if version > 1 else None
-                self.overlap = read_array("integrals/overlap") if version > 1 else None
-                self.eri = read_array("integrals/eri") if version > 1 else None
-
-                # 1 and 2 electron integrals in MO basis
-                self.mo_onee_ints = read_array("integrals/mo_onee_ints")
-                self.mo_onee_ints_b = \
-                    read_array("integrals/mo_onee_ints_B") if version > 1 else None
-                self.mo_eri_ints = read_array("integrals/mo_eri_ints")
-                self.mo_eri_ints_bb = \
-                    read_array("integrals/mo_eri_ints_BB") if version > 1 else None
-                self.mo_eri_ints_ba = \
-                    read_array("integrals/mo_eri_ints_BA") if version > 1 else None
-
-                # dipole integrals in AO basis
-                self.x_dip_ints = read_array("dipole/x_dip_ints") if version > 1 else None
-                self.y_dip_ints = read_array("dipole/y_dip_ints") if version > 1 else None
-                self.z_dip_ints = read_array("dipole/z_dip_ints") if version > 1 else None
-
-                # dipole integrals in MO basis
-                self.x_dip_mo_ints = read_array("dipole/x_dip_mo_ints")
-                self.x_dip_mo_ints_b = read_array("dipole/x_dip_mo_ints_B") if version > 1 else None
-                self.y_dip_mo_ints = read_array("dipole/y_dip_mo_ints")
-                self.y_dip_mo_ints_b = read_array("dipole/y_dip_mo_ints_B") if version > 1 else None
-                self.z_dip_mo_ints = read_array("dipole/z_dip_mo_ints")
-                self.z_dip_mo_ints_b = read_array("dipole/z_dip_mo_ints_B") if version > 1 else None
-                self.nuclear_dipole_moment = file["dipole/nuclear_dipole_moment"][...]
-                self.reverse_dipole_sign = file["dipole/reverse_dipole_sign"][...]
+            with h5py.File(self._filename, "r",
+                           rdcc_nbytes=QMolecule._H5_RDCC_NBYTES) as h5_file:
+                version = QMolecule._h5_file_format_version(h5_file)
+                attributes = QMolecule._H5_ATTRIBUTES if keys is None else \
+                    {key: QMolecule._H5_ATTRIBUTES[key] for key in keys}
+                for attr, (path, kind, min_version) in attributes.items():
+                    if version < min_version:
+                        value = '?' if kind == 'string' else None
+                    else:
+                        value = QMolecule._read_h5_dataset(h5_file, path, kind)
+                    setattr(self, attr, value)
 
         except OSError:
             pass
 
+    def open(self, fileobj=None):
+        """Opens the file for on-demand loading.
+
+        Each saved attribute is read from the file the first time it is
+        accessed, so datasets a caller never touches are never read. Use
+        close(), or a with statement, to release the file handle.
+
+        Args:
+            fileobj (io.IOBase): optional binary file-like object holding
+                the HDF5 contents to read from instead of the file itself.
+        """
+        self.close()
+        if fileobj is None and self._filename is None:
+            return
+        try:
+            h5_file = h5py.File(fileobj if fileobj is not None else self._filename,
+                                "r", rdcc_nbytes=QMolecule._H5_RDCC_NBYTES)
+        except OSError:
+            return
+
+        self._h5_file = h5_file
+        self._h5_file_version = QMolecule._h5_file_format_version(h5_file)
+        # defer the saved attributes to __getattr__
+        for attr in QMolecule._H5_ATTRIBUTES:
+            self.__dict__.pop(attr, None)
+
+    def close(self):
+        """Closes the file opened by open().
+
+        Attributes not accessed while the file was open are left at their
+        unloaded value.
+        """
+        if self._h5_file is not None:
+            self._h5_file.close()
+            self._h5_file = None
+            self._h5_file_version = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __getstate__(self):
+        # materialize any attribute still deferred by open() so the
+        # molecule can be pickled or deep-copied; the file handle itself
+        # cannot cross process or copy boundaries
+        if self._h5_file is not None:
+            for attr in QMolecule._H5_ATTRIBUTES:
+                getattr(self, attr)
+        state = self.__dict__.copy()
+        state['_h5_file'] = None
+        state['_h5_file_version'] = None
+        return state
+
+    def __getattr__(self, name):
+        # Only called when normal lookup fails, i.e. for saved attributes
+        # whose load was deferred by open(). Reads the dataset on first
+        # access and caches the value on the instance.
+        if name.startswith('_') or name not in QMolecule._H5_ATTRIBUTES:
+            raise AttributeError("'{}' object has no attribute '{}'".format(
+                type(self).__name__, name))
+
+        path, kind, min_version = QMolecule._H5_ATTRIBUTES[name]
+        h5_file = self.__dict__.get('_h5_file')
+        if h5_file is None or self._h5_file_version < min_version:
+            value = '?' if kind == 'string' else None
+        else:
+            value = QMolecule._read_h5_dataset(h5_file, path, kind)
+        setattr(self, name, value)
+        return value
+
     def save(self, file_name=None):
         """Saves the info from the driver."""
         file = None
@@ -39,7 +39,7 @@ requirements = [
     "fastdtw",
     "quandl",
     "setuptools>=40.1.0",
-    "h5py",
+    "h5py>=2.9",
     "networkx>=2.2",
     "pyscf; sys_platform != 'win32'",
 ]
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test Variational Form """
+
+import unittest
+from test.aqua.common import QiskitAquaTestCase
+
+import numpy as np
+from qiskit.circuit import ParameterVector
+
+from qiskit.aqua.components.variational_forms import RY
+
+
+class TestVariationalForm(QiskitAquaTestCase):
+    """ Test base VariationalForm behavior """
+
+    def test_parameter_bounds(self):
+        """ parameter bounds frozen tuple test """
+        var_form = RY(2, depth=1)
+        bounds = var_form.parameter_bounds
+        self.assertIsInstance(bounds, tuple)
+        self.assertEqual(len(bounds), var_form.num_parameters)
+
+    def test_parameter_bounds_array(self):
+        """ cached bounds array follows a bounds reassignment test """
+        var_form = RY(2, depth=1)
+        np.testing.assert_array_almost_equal(var_form.parameter_bounds_array,
+                                             var_form.parameter_bounds)
+        # adaptive forms such as UCCSD reassign _bounds after construction;
+        # the cached array view must not keep serving the old bounds
+        new_bounds = [(-1.0, 1.0)] * var_form.num_parameters
+        var_form._bounds = new_bounds
+        np.testing.assert_array_almost_equal(var_form.parameter_bounds_array,
+                                             new_bounds)
+        # reassigning an already-frozen tuple must invalidate as well
+        newer_bounds = tuple((-0.5, 0.5) for _ in range(var_form.num_parameters))
+        var_form._bounds = newer_bounds
+        np.testing.assert_array_almost_equal(var_form.parameter_bounds_array,
+                                             newer_bounds)
+
+    def test_construct_circuit_template_cached(self):
+        """ default construct_circuit builds the template once test """
+        var_form = RY(2, depth=1)
+        circuit_first = var_form.construct_circuit(np.zeros(var_form.num_parameters))
+        template = var_form._template_circuit
+        self.assertIsNotNone(template)
+        circuit_second = var_form.construct_circuit(np.ones(var_form.num_parameters))
+        # the second call rebinds the same cached template
+        self.assertIs(var_form._template_circuit, template)
+        self.assertEqual(len(circuit_first.parameters), 0)
+        self.assertEqual(len(circuit_second.parameters), 0)
+
+    def test_construct_circuit_symbolic(self):
+        """ construct_circuit with symbolic parameters test """
+        var_form = RY(2, depth=1)
+        params = ParameterVector('p', var_form.num_parameters)
+        circuit = var_form.construct_circuit(params)
+        self.assertEqual(len(circuit.parameters), var_form.num_parameters)
+
+    def test_construct_circuit_invalid_size(self):
+        """ construct_circuit with wrong number of parameters test """
+        var_form = RY(2, depth=1)
+        with self.assertRaises(ValueError):
+            var_form.construct_circuit(np.zeros(var_form.num_parameters + 1))
+
+    def test_parameter_bounds_array_unbounded(self):
+        """ bounds array is None when not fully bounded test """
+        var_form = RY(2, depth=1)
+        var_form._bounds = [(None, None)] * var_form.num_parameters
+        self.assertIsNone(var_form.parameter_bounds_array)
+
+
+if __name__ == '__main__':
+    unittest.main()
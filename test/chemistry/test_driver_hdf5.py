@@ -14,9 +14,14 @@
 
 """ Test Driver HDF5 """
 
+import copy
+import os
+import tempfile
 import unittest
 from test.chemistry.common import QiskitChemistryTestCase
 from test.chemistry.test_driver import TestDriver
+import h5py
+from qiskit.chemistry import QMolecule
 from qiskit.chemistry.drivers import HDF5Driver
 
 
@@ -29,5 +34,64 @@ class TestDriverHDF5(QiskitChemistryTestCase, TestDriver):
         self.qmolecule = driver.run()
 
 
+class TestDriverHDF5Molecule(QiskitChemistryTestCase):
+    """HDF5 Driver on-demand molecule tests."""
+
+    def setUp(self):
+        super().setUp()
+        self.hdf5_input = self._get_resource_path('test_driver_hdf5.hdf5')
+
+    def test_context_manager(self):
+        """ molecule context manager test """
+        driver = HDF5Driver(hdf5_input=self.hdf5_input)
+        with driver.run() as qmolecule:
+            self.assertAlmostEqual(qmolecule.hf_energy, -1.117, places=3)
+
+    def test_close(self):
+        """ molecule close test """
+        driver = HDF5Driver(hdf5_input=self.hdf5_input)
+        qmolecule = driver.run()
+        self.assertEqual(qmolecule.num_orbitals, 2)
+        qmolecule.close()
+        # attributes read while the file was open stay loaded, the rest
+        # remain at their unloaded value
+        self.assertEqual(qmolecule.num_orbitals, 2)
+        self.assertIsNone(qmolecule.hf_energy)
+
+    def test_deepcopy(self):
+        """ deep copy of an opened molecule test """
+        driver = HDF5Driver(hdf5_input=self.hdf5_input)
+        qmolecule = copy.deepcopy(driver.run())
+        self.assertAlmostEqual(qmolecule.hf_energy, -1.117, places=3)
+        self.assertEqual(qmolecule.num_orbitals, 2)
+
+    def test_load_keys(self):
+        """ load restricted to given keys test """
+        qmolecule = QMolecule(self.hdf5_input)
+        qmolecule.load(keys=['hf_energy', 'num_orbitals'])
+        self.assertAlmostEqual(qmolecule.hf_energy, -1.117, places=3)
+        self.assertEqual(qmolecule.num_orbitals, 2)
+        self.assertIsNone(qmolecule.mo_coeff)
+
+    def test_version_one_format(self):
+        """ load of version 1 save format test """
+        file, hdf5_file = tempfile.mkstemp(suffix='.hdf5')
+        os.close(file)
+        self.addCleanup(os.unlink, hdf5_file)
+        # round-trip the fixture through save() to get a current, version 2
+        # file, then strip its version dataset to exercise the fallback
+        qmolecule = QMolecule(self.hdf5_input)
+        qmolecule.load()
+        qmolecule.save(hdf5_file)
+        with h5py.File(hdf5_file, 'a') as h5_file:
+            del h5_file['version']
+
+        qmolecule = QMolecule(hdf5_file)
+        qmolecule.load()
+        self.assertAlmostEqual(qmolecule.hf_energy, -1.117, places=3)
+        self.assertEqual(qmolecule.origin_driver_version, '?')
+        self.assertIsNone(qmolecule.mo_coeff_b)
+
+
 if __name__ == '__main__':
     unittest.main()